@@ -3,9 +3,20 @@
 import argparse
 import sys
 import json
-from udblib.parser import UDBParser
+from udblib.parser import UDBParser, DEFAULT_CACHE_DIR
 from udblib.decoder import Decoder
 
+# orjson is optional; it serializes much faster than the stdlib json module.
+# Unlike json.dumps it emits non-ASCII characters as UTF-8 instead of \uXXXX escapes.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 def parse_int(s: str) -> int:
     s = s.strip()
     if s.startswith("0x") or s.startswith("0X"):
@@ -15,40 +26,46 @@ def parse_int(s: str) -> int:
     return int(s, 0)
 
 def pretty_print_decode(name, decoded, compact=True):
-    print(f"CSR: {name}")
+    # build the whole block and emit it with one write
+    parts = [f"CSR: {name}"]
     if compact:
+        items = []
         for f in decoded:
-            bits = f"[{f['msb']}:{f['lsb']}]" if f['msb'] != f['lsb'] else f"[{f['msb']}]"
-            access_type = f" ({f['access_type']})" if f.get('access_type') else ""
-            print(f"{f['name']}{bits}={f['bin']}{access_type}", end=', ')
+            bits = f"[{f.msb}:{f.lsb}]" if f.msb != f.lsb else f"[{f.msb}]"
+            access_type = f" ({f.access_type})" if f.access_type else ""
+            items.append(f"{f.name}{bits}={f.bin}{access_type}, ")
+        parts.append("".join(items))
     else:
         for f in decoded:
-            access_type = f" ({f['access_type']})" if f.get('access_type') else ""
-            print(f" {f['name']:20} [{f['msb']:2d}:{f['lsb']:2d}] = {f['hex']:>6} / {f['value']:>3} / {f['bin']:>10}{access_type}")
-            #  {f.get('desc','')}
-    print()
+            access_type = f" ({f.access_type})" if f.access_type else ""
+            parts.append(f" {f.name:20} [{f.msb:2d}:{f.lsb:2d}] = {f.hex:>6} / {f.value:>3} / {f.bin:>10}{access_type}")
+            #  {f.desc}
+        parts.append("")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 def pretty_print_diff(name, diffs):
-    print(f"CSR: {name} (fields with changes)")
+    parts = [f"CSR: {name} (fields with changes)"]
     for d in diffs:
         access_type = f" ({d['access_type']})" if d.get('access_type') else ""
-        print(f" {d['name']:20} [{d['msb']:2d}:{d['lsb']:2d}] changed_mask={d['changed_mask']:>10} rel={d['changed_rel']:>6} bits_changed={d['changed_bits_count']:>2}{access_type}  {d.get('desc','')}")
-    print()
+        parts.append(f" {d['name']:20} [{d['msb']:2d}:{d['lsb']:2d}] changed_mask={d['changed_mask']:>10} rel={d['changed_rel']:>6} bits_changed={d['changed_bits_count']:>2}{access_type}  {d.get('desc','')}")
+    parts.append("")
+    sys.stdout.write("\n".join(parts) + "\n")
 
-def pretty_print_compare(name, decoded1, decoded2, compact=False):
-    print(f"CSR: {name} (field differences)")
+def pretty_print_compare(name, differences, compact=False):
+    parts = [f"CSR: {name} (field differences)"]
     if compact:
-        for f1, f2 in zip(decoded1, decoded2):
-            if f1['value'] != f2['value']:
-                bits = f"[{f1['msb']}:{f1['lsb']}]" if f1['msb'] != f1['lsb'] else f"[{f1['msb']}]"
-                access_type = f" ({f1['access_type']})" if f1.get('access_type') else ""
-                print(f"{f1['name']}{bits}={f1['bin']} vs {f2['bin']}{access_type}", end=', ')
+        items = []
+        for f1, f2 in differences:
+            bits = f"[{f1.msb}:{f1.lsb}]" if f1.msb != f1.lsb else f"[{f1.msb}]"
+            access_type = f" ({f1.access_type})" if f1.access_type else ""
+            items.append(f"{f1.name}{bits}={f1.bin} vs {f2.bin}{access_type}, ")
+        parts.append("".join(items))
     else:
-        for f1, f2 in zip(decoded1, decoded2):
-            if f1['value'] != f2['value']:
-                access_type = f" ({f1['access_type']})" if f1.get('access_type') else ""
-                print(f" {f1['name']:20} [{f1['msb']:2d}:{f1['lsb']:2d}] = {f1['hex']:>6} / {f1['value']:>3} / {f1['bin']:>10} vs {f2['hex']:>6} / {f2['value']:>3} / {f2['bin']:>10}{access_type} \"{f1['desc']}\"")
-    print()
+        for f1, f2 in differences:
+            access_type = f" ({f1.access_type})" if f1.access_type else ""
+            parts.append(f" {f1.name:20} [{f1.msb:2d}:{f1.lsb:2d}] = {f1.hex:>6} / {f1.value:>3} / {f1.bin:>10} vs {f2.hex:>6} / {f2.value:>3} / {f2.bin:>10}{access_type} \"{f1.desc}\"")
+        parts.append("")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 def main(argv=None):
     p = argparse.ArgumentParser(prog="udb-csr", description="Decode RISC-V CSR values using riscv-unified-db")
@@ -60,6 +77,7 @@ def main(argv=None):
         parser.add_argument("--config", help="Path to riscv-config YAML (e.g., rv64i_isa_checked.yaml) for CSR type info (WARL/WLRL)")
         parser.add_argument("--xlen", type=int, default=64, help="XLEN (default 64)")
         parser.add_argument("--json", action="store_true", help="Output machine-readable JSON")
+        parser.add_argument("--no-cache", action="store_true", help="Always re-parse the spec directory instead of using the pickled CSR cache")
 
     dec = sub.add_parser("decode", help="Decode CSR value into bitfields")
     add_common(dec)
@@ -79,7 +97,8 @@ def main(argv=None):
 
     args = p.parse_args(argv)
 
-    parser = UDBParser(args.spec, riscv_config_yaml=args.config if hasattr(args, 'config') else None)
+    parser = UDBParser(args.spec, riscv_config_yaml=args.config if hasattr(args, 'config') else None,
+                       cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
     csrs = parser.load_all()
     csr = parser.get(args.csr)
     if csr is None:
@@ -94,26 +113,25 @@ def main(argv=None):
         val = parse_int(args.value)
         decoded = decoder.decode_value(csr, val)
         if args.json:
-            print(json.dumps({"csr": csr.name, "value": hex(val), "decoded": decoded}, indent=2))
+            print(_dumps({"csr": csr.name, "value": hex(val), "decoded": [f.to_dict() for f in decoded]}))
         else:
             pretty_print_decode(csr.name, decoded)
     elif args.cmd == "diff":
         xm = parse_int(args.xor)
         diffs = decoder.decode_xor_mask(csr, xm)
         if args.json:
-            print(json.dumps({"csr": csr.name, "xor": hex(xm), "changes": diffs}, indent=2))
+            print(_dumps({"csr": csr.name, "xor": hex(xm), "changes": diffs}))
         else:
             pretty_print_diff(csr.name, diffs)
     elif args.cmd == "compare":
         val1 = parse_int(args.value1)
         val2 = parse_int(args.value2)
-        decoded1 = decoder.decode_value(csr, val1)
-        decoded2 = decoder.decode_value(csr, val2)
+        differences = decoder.compare_values(csr, val1, val2)
         if args.json:
-            diffs = [{"field": f1["name"], "value1": f1["value"], "value2": f2["value"]} for f1, f2 in zip(decoded1, decoded2) if f1["value"] != f2["value"]]
-            print(json.dumps({"csr": csr.name, "value1": hex(val1), "value2": hex(val2), "differences": diffs}, indent=2))
+            diffs = [{"field": f1.name, "value1": f1.value, "value2": f2.value} for f1, f2 in differences]
+            print(_dumps({"csr": csr.name, "value1": hex(val1), "value2": hex(val2), "differences": diffs}))
         else:
-            pretty_print_compare(csr.name, decoded1, decoded2)
+            pretty_print_compare(csr.name, differences)
     else:
         p.print_help()
 
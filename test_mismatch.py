@@ -4,6 +4,7 @@ Simple test for CSR mismatch verification
 Based on mismatch info at PC 0x0080000058
 """
 
+import sys
 from udblib.parser import UDBParser
 from udblib.decoder import Decoder
 
@@ -36,13 +37,16 @@ def test_csr_mismatch():
     print("=" * 80)
     
     for csr_name, data in mismatches.items():
-        print(f"\n{'=' * 80}")
-        print(f"CSR: {csr_name.upper()}")
-        print(f"{'=' * 80}")
+        # collect the whole per-CSR report and write it once
+        out = []
+        out.append(f"\n{'=' * 80}")
+        out.append(f"CSR: {csr_name.upper()}")
+        out.append(f"{'=' * 80}")
         
         csr = parser.get(csr_name)
         if csr is None:
-            print(f"ERROR: CSR '{csr_name}' not found")
+            out.append(f"ERROR: CSR '{csr_name}' not found")
+            sys.stdout.write("\n".join(out) + "\n")
             continue
         
         # Parse values
@@ -50,50 +54,52 @@ def test_csr_mismatch():
         dut_val = int(data['dut'], 16)
         xor_mask = ref_val ^ dut_val
         
-        print(f"REF value: {data['ref']} ({ref_val})")
-        print(f"DUT value: {data['dut']} ({dut_val})")
-        print(f"XOR mask:  0x{xor_mask:016x}\n")
+        out.append(f"REF value: {data['ref']} ({ref_val})")
+        out.append(f"DUT value: {data['dut']} ({dut_val})")
+        out.append(f"XOR mask:  0x{xor_mask:016x}\n")
         
         # Decode both values
-        print(f"--- Reference Value Decoding ---")
+        out.append(f"--- Reference Value Decoding ---")
         ref_decoded = decoder.decode_value(csr, ref_val)
         for f in ref_decoded:
-            bits = f"[{f['msb']}:{f['lsb']}]" if f['msb'] != f['lsb'] else f"[{f['msb']}]"
-            access_type = f" ({f['access_type']})" if f.get('access_type') else ""
-            print(f"  {f['name']:20} {bits:10} = {f['bin']:>10} ({f['value']:>5}){access_type} {f.get('desc', '')}")
+            bits = f"[{f.msb}:{f.lsb}]" if f.msb != f.lsb else f"[{f.msb}]"
+            access_type = f" ({f.access_type})" if f.access_type else ""
+            out.append(f"  {f.name:20} {bits:10} = {f.bin:>10} ({f.value:>5}){access_type} {f.desc}")
         
-        print(f"\n--- DUT Value Decoding ---")
+        out.append(f"\n--- DUT Value Decoding ---")
         dut_decoded = decoder.decode_value(csr, dut_val)
         for f in dut_decoded:
-            bits = f"[{f['msb']}:{f['lsb']}]" if f['msb'] != f['lsb'] else f"[{f['msb']}]"
-            access_type = f" ({f['access_type']})" if f.get('access_type') else ""
-            print(f"  {f['name']:20} {bits:10} = {f['bin']:>10} ({f['value']:>5}){access_type} {f.get('desc', '')}")
+            bits = f"[{f.msb}:{f.lsb}]" if f.msb != f.lsb else f"[{f.msb}]"
+            access_type = f" ({f.access_type})" if f.access_type else ""
+            out.append(f"  {f.name:20} {bits:10} = {f.bin:>10} ({f.value:>5}){access_type} {f.desc}")
         
         # Show differences
-        print(f"\n--- Differences ---")
+        out.append(f"\n--- Differences ---")
         differences_found = False
         for f1, f2 in zip(ref_decoded, dut_decoded):
-            if f1['value'] != f2['value']:
+            if f1.value != f2.value:
                 differences_found = True
-                bits = f"[{f1['msb']}:{f1['lsb']}]" if f1['msb'] != f1['lsb'] else f"[{f1['msb']}]"
-                access_type = f" ({f1['access_type']})" if f1.get('access_type') else ""
-                print(f"  {f1['name']:20} {bits:10}: REF={f1['bin']:>10} ({f1['value']:>5}) vs DUT={f2['bin']:>10} ({f2['value']:>5}){access_type}")
-                print(f"    Description: {f1.get('desc', 'N/A')}")
+                bits = f"[{f1.msb}:{f1.lsb}]" if f1.msb != f1.lsb else f"[{f1.msb}]"
+                access_type = f" ({f1.access_type})" if f1.access_type else ""
+                out.append(f"  {f1.name:20} {bits:10}: REF={f1.bin:>10} ({f1.value:>5}) vs DUT={f2.bin:>10} ({f2.value:>5}){access_type}")
+                out.append(f"    Description: {f1.desc}")
         
         if not differences_found:
-            print("  No differences found in decoded fields")
+            out.append("  No differences found in decoded fields")
         
         # Show changed fields using XOR mask
-        print(f"\n--- Changed Fields (using XOR mask) ---")
+        out.append(f"\n--- Changed Fields (using XOR mask) ---")
         try:
             changes = decoder.decode_xor_mask(csr, xor_mask)
             if changes:
                 for c in changes:
-                    print(f"  {c['name']:20} [{c['msb']:2d}:{c['lsb']:2d}] changed_mask={c['changed_mask']} bits={c.get('changed_bits_count', 'N/A')}")
+                    out.append(f"  {c['name']:20} [{c['msb']:2d}:{c['lsb']:2d}] changed_mask={c['changed_mask']} bits={c.get('changed_bits_count', 'N/A')}")
             else:
-                print("  No fields changed according to XOR mask analysis")
+                out.append("  No fields changed according to XOR mask analysis")
         except Exception as e:
-            print(f"  XOR mask analysis skipped: {e}")
+            out.append(f"  XOR mask analysis skipped: {e}")
+        
+        sys.stdout.write("\n".join(out) + "\n")
     
     print("\n" + "=" * 80)
     print("Test completed")
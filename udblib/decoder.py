@@ -1,32 +1,81 @@
 # udblib/decoder.py
 # Decoder: decode values or xor-diffs given CSRDefinition instances from parser
 from __future__ import annotations
-from typing import List, Dict, Any
+from collections import namedtuple
+from typing import List, Dict, Any, Iterable, Tuple
 from .parser import CSRDefinition, CSRField
 
+class FieldDecoded(namedtuple("FieldDecoded", "name msb lsb width value desc access_type")):
+    """One decoded field. hex/bin strings are formatted on access, not at decode time."""
+    __slots__ = ()
+
+    @property
+    def hex(self) -> str:
+        return hex(self.value)
+
+    @property
+    def bin(self) -> str:
+        return bin(self.value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "msb": self.msb,
+            "lsb": self.lsb,
+            "width": self.width,
+            "value": self.value,
+            "hex": self.hex,
+            "bin": self.bin,
+            "desc": self.desc,
+            "access_type": self.access_type
+        }
+
 class Decoder:
     def __init__(self, xlen: int = 64):
         self.xlen = xlen
 
-    def decode_value(self, csr: CSRDefinition, value: int) -> List[Dict[str, Any]]:
+    def decode_value(self, csr: CSRDefinition, value: int) -> List[FieldDecoded]:
         """
         Decode full value into fields.
-        Returns list of dicts with keys: name, msb, lsb, width, raw_value, hex, bin, desc, access_type
+        Returns list of FieldDecoded(name, msb, lsb, width, value, desc, access_type);
+        .hex/.bin are derived from value on access.
+        """
+        return [FieldDecoded(f.name, f.msb, f.lsb, f.width, raw, f.desc, f.access_type)
+                for f, raw in zip(csr.sorted_fields, self.decode_value_raw(csr, value))]
+
+    def decode_value_raw(self, csr: CSRDefinition, value: int) -> Tuple[int, ...]:
+        """
+        Decode full value into raw field values only, in csr.sorted_fields order.
+        Cheaper than decode_value when the caller just compares values.
+        """
+        return csr.raw_decoder(value)
+
+    def decode_many(self, csr: CSRDefinition, values: Iterable[int]) -> List[Tuple[int, ...]]:
+        """
+        Batched decode_value_raw: one row of raw field values per input value,
+        columns in csr.sorted_fields order. Meant for trace/regression replays.
+        """
+        decode = csr.raw_decoder
+        return [decode(v) for v in values]
+
+    def compare_values(self, csr: CSRDefinition, value1: int, value2: int) -> List[Tuple[FieldDecoded, FieldDecoded]]:
+        """
+        Return (decoded1, decoded2) pairs for the fields whose value differs between
+        value1 and value2, in csr.sorted_fields order. Only differing fields are decoded.
         """
         out = []
-        for f in sorted(csr.fields, key=lambda ff: ff.msb, reverse=True):
-            raw = (value & f.mask()) >> f.lsb
-            out.append({
-                "name": f.name,
-                "msb": f.msb,
-                "lsb": f.lsb,
-                "width": f.width,
-                "value": int(raw),
-                "hex": hex(int(raw)),
-                "bin": bin(int(raw)),
-                "desc": f.desc,
-                "access_type": f.access_type if hasattr(f, 'access_type') else ""
-            })
+        xor_mask = value1 ^ value2
+        if not xor_mask:
+            return out
+        # same early exit as decode_xor_mask
+        lowest = (xor_mask & -xor_mask).bit_length() - 1
+        for f in csr.sorted_fields:
+            if f.msb < lowest:
+                break
+            m = f.mask
+            if m & xor_mask:
+                out.append((FieldDecoded(f.name, f.msb, f.lsb, f.width, (value1 & m) >> f.lsb, f.desc, f.access_type),
+                            FieldDecoded(f.name, f.msb, f.lsb, f.width, (value2 & m) >> f.lsb, f.desc, f.access_type)))
         return out
 
     def decode_xor_mask(self, csr: CSRDefinition, xor_mask: int) -> List[Dict[str, Any]]:
@@ -35,8 +84,16 @@ class Decoder:
         For each changed field, include changed_bitmask (bits inside field that changed).
         """
         out = []
-        for f in sorted(csr.fields, key=lambda ff: ff.msb, reverse=True):
-            changed = f.changed_bits(xor_mask)
+        if not xor_mask:
+            return out
+        masks, _ = csr.layout
+        # Fields are ordered by msb descending, so once a field sits entirely
+        # below the lowest set bit of xor_mask no later field can match.
+        lowest = (xor_mask & -xor_mask).bit_length() - 1
+        for f, m in zip(csr.sorted_fields, masks):
+            if f.msb < lowest:
+                break
+            changed = m & xor_mask
             if changed:
                 # bits relative to lsb
                 rel = (changed >> f.lsb)
@@ -51,4 +108,20 @@ class Decoder:
                     "desc": f.desc,
                     "access_type": f.access_type if hasattr(f, 'access_type') else ""
                 })
-        return out
\ No newline at end of file
+        return out
+
+    def decode_xor_mask_raw(self, csr: CSRDefinition, xor_mask: int) -> List[int]:
+        """
+        Per-field changed bitmasks (absolute bit positions) in csr.sorted_fields order.
+        Zero means the field is untouched by xor_mask.
+        """
+        masks, _ = csr.layout
+        return [m & xor_mask for m in masks]
+
+    def decode_xor_many(self, csr: CSRDefinition, xor_masks: Iterable[int]) -> List[List[int]]:
+        """
+        Batched decode_xor_mask_raw: one row of per-field changed bitmasks per xor mask,
+        columns in csr.sorted_fields order.
+        """
+        masks, _ = csr.layout
+        return [[m & x for m in masks] for x in xor_masks]
@@ -2,37 +2,72 @@
 # UDB parser: load CSR definitions from riscv-unified-db spec/csrs YAML/JSON files
 from __future__ import annotations
 import os
-import glob
-import json
 import yaml
 import re
-from typing import List, Dict, Optional, Any, Tuple
+import pickle
+import mmap
+import hashlib
+import tempfile
+from sys import intern
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections.abc import Hashable
+from typing import List, Dict, Optional, Any, Tuple, Callable
+
+# orjson parses JSON spec files faster than the stdlib when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# libyaml-backed loader when PyYAML was built with it (several times faster), else pure Python
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+def _intern(s: Any) -> Any:
+    """sys.intern for the small vocabularies (types, privilege modes) repeated on every field/CSR."""
+    return intern(s) if type(s) is str else s
 
 class CSRField:
+    __slots__ = ("name", "msb", "lsb", "_desc_raw", "field_type", "reset_value", "alias",
+                 "access_type", "legal_values", "width", "mask")
+
     def __init__(self, name: str, msb: int, lsb: int, desc: str = "", field_type: str = "", reset_value: Any = None, alias: str = "", 
                  access_type: str = "", legal_values: Any = None):
         self.name = name
         self.msb = msb
         self.lsb = lsb
-        self.desc = desc.strip().replace('\n',' ')
-        self.field_type = field_type
+        # normalized on first read of .desc; tolerate non-string YAML scalars here
+        self._desc_raw = desc if isinstance(desc, str) else ("" if desc is None else str(desc))
+        self.field_type = _intern(field_type)
         self.reset_value = reset_value
         self.alias = alias
-        self.access_type = access_type  # WARL, WLRL, WPRI, WIRI, ro_constant, ro_variable, etc.
+        self.access_type = _intern(access_type)  # WARL, WLRL, WPRI, WIRI, ro_constant, ro_variable, etc.
         self.legal_values = legal_values  # Legal values for WARL fields (stored but not printed by default)
+        # msb/lsb never change after construction, so derive the masks once
+        self.width = msb - lsb + 1
+        self.mask = ((1 << self.width) - 1) << lsb
 
-    @property
-    def width(self) -> int:
-        return self.msb - self.lsb + 1
+    @classmethod
+    def from_raw(cls, name: str, msb: int, lsb: int, fd: Dict[str, Any]) -> "CSRField":
+        """Build a field from its UDB field mapping (the value under fields.<name>)."""
+        g = fd.get
+        return cls(name, msb, lsb, g("description", ""), g("type", ""), g("reset_value"), g("alias", ""))
 
-    def mask(self) -> int:
-        return ((1 << self.width) - 1) << self.lsb
+    @property
+    def desc(self) -> str:
+        d = self._desc_raw
+        if '\n' in d or d != d.strip():
+            d = self._desc_raw = d.strip().replace('\n',' ')
+        return d
 
     def contains_any(self, mask: int) -> bool:
-        return (self.mask() & mask) != 0
+        return (self.mask & mask) != 0
 
     def changed_bits(self, xor_mask: int) -> int:
-        return self.mask() & xor_mask
+        return self.mask & xor_mask
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -45,24 +80,111 @@ class CSRField:
             "reset_value": self.reset_value,
             "alias": self.alias,
             "access_type": self.access_type,
-            "mask": hex(self.mask())
+            "mask": hex(self.mask)
         }
 
+def _compile_raw_decoder(masks: Tuple[int, ...], lsbs: Tuple[int, ...]) -> Callable[[int], Tuple[int, ...]]:
+    """Partially evaluate the field extraction for one fixed layout into straight-line code."""
+    terms = [f"(v & {hex(m)}) >> {l}" if l else f"v & {hex(m)}" for m, l in zip(masks, lsbs)]
+    src = "def _decode(v):\n    return (" + "".join(t + ", " for t in terms) + ")\n"
+    ns: Dict[str, Any] = {}
+    exec(src, ns)
+    return ns["_decode"]
+
 class CSRDefinition:
-    def __init__(self, name: str, raw: Dict[str, Any]):
+    __slots__ = ("name", "raw", "raw_path", "fields", "long_name", "length", "description", "writable",
+                 "priv_mode", "definedBy", "_sorted_fields", "_mask_arr", "_lsb_arr", "_decode_fast",
+                 "skipped_fields")
+
+    def __init__(self, name: str, *, long_name: str = "", length: Any = 64, description: str = "",
+                 writable: bool = False, priv_mode: str = "", definedBy: Any = None,
+                 raw: Optional[Dict[str, Any]] = None, raw_path: Optional[str] = None):
         self.name = name
+        # the full spec mapping is large and unused after parsing; only kept if passed in
         self.raw = raw
-        self.fields: List[CSRField] = []
-        self.long_name = raw.get("long_name", "")
-        self.length = raw.get("length", 64)
-        self.description = raw.get("description", "")
-        self.writable = raw.get("writable", False)
-        self.priv_mode = raw.get("priv_mode", "")
-        self.definedBy = raw.get("definedBy", {})
+        self.raw_path = raw_path
+        self.fields: List[CSRField] = []  # msb descending, maintained by add_field
+        self._sorted_fields: Optional[Tuple[CSRField, ...]] = None
+        self._mask_arr: Tuple[int, ...] = ()
+        self._lsb_arr: Tuple[int, ...] = ()
+        self._decode_fast: Optional[Callable[[int], Tuple[int, ...]]] = None
+        self.long_name = long_name
+        self.length = length
+        self.description = description
+        self.writable = writable
+        self.priv_mode = _intern(priv_mode)
+        self.definedBy = definedBy if definedBy is not None else {}
+        self.skipped_fields = 0  # spec fields dropped for a missing/invalid location
         # populate fields via load_all
 
     def add_field(self, field: CSRField):
-        self.fields.append(field)
+        # keep fields ordered by msb descending (ties keep insertion order) so the
+        # decode order never needs a sort; spec files mostly list fields that way
+        fields = self.fields
+        i = len(fields)
+        while i and fields[i - 1].msb < field.msb:
+            i -= 1
+        fields.insert(i, field)
+        self._sorted_fields = None
+        self._decode_fast = None
+
+    @property
+    def sorted_fields(self) -> Tuple[CSRField, ...]:
+        """Immutable snapshot of fields (msb descending, i.e. decode order), cached until the next add_field."""
+        if self._sorted_fields is None:
+            self._build_layout()
+        return self._sorted_fields
+
+    @property
+    def layout(self) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+        """Parallel (masks, lsbs) tuples in sorted_fields order, for bulk bit extraction."""
+        if self._sorted_fields is None:
+            self._build_layout()
+        return self._mask_arr, self._lsb_arr
+
+    def fields_touching(self, mask: int) -> List[int]:
+        """Indices (into fields / sorted_fields) of the fields overlapping any bit of mask."""
+        masks, _ = self.layout
+        return [i for i, m in enumerate(masks) if m & mask]
+
+    def _build_layout(self):
+        fields = tuple(self.fields)
+        self._mask_arr = tuple(f.mask for f in fields)
+        self._lsb_arr = tuple(f.lsb for f in fields)
+        self._sorted_fields = fields
+
+    @property
+    def raw_decoder(self) -> Callable[[int], Tuple[int, ...]]:
+        """
+        value -> tuple of raw field values in sorted_fields order.
+        Generated on first use with every mask/shift inlined as a literal.
+        """
+        if self._decode_fast is None:
+            self._decode_fast = _compile_raw_decoder(*self.layout)
+        return self._decode_fast
+
+    def __getstate__(self):
+        # generated functions cannot be pickled; they are rebuilt on demand
+        state = {k: getattr(self, k) for k in self.__slots__}
+        state["_decode_fast"] = None
+        return state
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+        # unpickled strings (cache, pool workers) are fresh copies; share them again
+        self.priv_mode = _intern(self.priv_mode)
+        for f in self.fields:
+            f.field_type = _intern(f.field_type)
+            f.access_type = _intern(f.access_type)
+
+    def load_raw(self) -> Optional[Dict[str, Any]]:
+        """Full spec mapping: the stored one, else re-read from raw_path (None if unavailable)."""
+        if self.raw is not None or self.raw_path is None:
+            return self.raw
+        with open(self.raw_path, "rb") as f:
+            data = f.read()
+        return _json_loads(data) if self.raw_path.endswith(".json") else yaml.load(data, Loader=_Loader)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -74,10 +196,60 @@ class CSRDefinition:
             "priv_mode": self.priv_mode,
             "definedBy": self.definedBy,
             "fields": [f.to_dict() for f in self.fields],
-            "raw": self.raw
+            "raw": self.raw,  # None unless passed to the constructor; see load_raw()
+            "raw_path": self.raw_path
         }
 
 # Utility: parse various forms of bit-range representations
+_RANGE_SEPS = ("..", ":", "-")
+
+def _range_int(bits_spec: int) -> Tuple[int,int]:
+    return bits_spec, bits_spec
+
+def _range_seq(bits_spec) -> Tuple[int,int]:
+    if len(bits_spec) < 2:
+        return _range_str(str(bits_spec))  # rejected like any other unparsable spec
+    a, b = int(bits_spec[0]), int(bits_spec[1])
+    return (a, b) if a >= b else (b, a)
+
+def _range_dict(bits_spec: Dict[str, Any]) -> Tuple[int,int]:
+    # from/to is an unordered pair; handle it on its own so a lone "to" is no longer
+    # read as both msb and lsb (the old key scan turned {"to": 5} into bit 5)
+    if "from" in bits_spec and "to" in bits_spec:
+        a, b = int(bits_spec["from"]), int(bits_spec["to"])
+        return (a, b) if a >= b else (b, a)
+    g = bits_spec.get
+    msb = g("msb", g("hi", g("high")))
+    lsb = g("lsb", g("lo", g("low")))
+    if msb is not None and lsb is not None:
+        msb, lsb = int(msb), int(lsb)
+        return (msb, lsb) if msb >= lsb else (lsb, msb)
+    raise ValueError(f"Unrecognized dict bits_spec: {bits_spec}")
+
+def _range_str(s: str) -> Tuple[int,int]:
+    # string forms: "31..12", "31:12", "31-12", "33-32"
+    s = s.strip()
+    # single number "7" (isdecimal accepts exactly what \d does, without the regex)
+    if s.isdecimal():
+        b = int(s)
+        return (b,b)
+    # "hi<sep>lo" with optional spaces around the separator; split on the separator
+    # directly instead of running a regex (same strings accepted as ^\d+\s*(..|:|-)\s*\d+$)
+    for sep in _RANGE_SEPS:
+        i = s.find(sep)
+        if i > 0:
+            hi, lo = s[:i].rstrip(), s[i + len(sep):].lstrip()
+            if hi.isdecimal() and lo.isdecimal():
+                a, b = int(hi), int(lo)
+                return (a,b) if a >= b else (b,a)
+            break
+    raise ValueError(f"Unrecognized bits spec string: '{s}'")
+
+# Exact-type dispatch for what YAML/JSON loaders actually produce; bool is listed
+# because it is an int subclass and used to be accepted as bit 0/1.
+_RANGE_SPEC_DISPATCH = {int: _range_int, bool: _range_int, str: _range_str,
+                        list: _range_seq, tuple: _range_seq, dict: _range_dict}
+
 def parse_range_spec(bits_spec) -> Tuple[int,int]:
     """
     Accepts schema-supported styles for location:
@@ -87,118 +259,279 @@ def parse_range_spec(bits_spec) -> Tuple[int,int]:
     - list/tuple [31,12]
     Returns (msb, lsb) with msb >= lsb
     """
+    fn = _RANGE_SPEC_DISPATCH.get(type(bits_spec))
+    if fn is not None:
+        return fn(bits_spec)
     if bits_spec is None:
         raise ValueError("bits_spec is None")
-    # direct ints
+    # subclasses of the dispatched types (e.g. OrderedDict) keep the old isinstance routing
     if isinstance(bits_spec, int):
-        return bits_spec, bits_spec
-    if isinstance(bits_spec, (list, tuple)) and len(bits_spec) >= 2:
-        a, b = int(bits_spec[0]), int(bits_spec[1])
-        return (a, b) if a >= b else (b, a)
+        return _range_int(bits_spec)
+    if isinstance(bits_spec, (list, tuple)):
+        return _range_seq(bits_spec)
     if isinstance(bits_spec, dict):
-        msb = None
-        lsb = None
-        for k in ("msb","hi","from","to","high"):
-            if k in bits_spec:
-                msb = int(bits_spec[k])
-                break
-        for k in ("lsb","lo","to","low"):
-            if k in bits_spec:
-                lsb = int(bits_spec[k])
-                break
-        if msb is not None and lsb is not None:
-            return (msb, lsb) if msb >= lsb else (lsb, msb)
-        raise ValueError(f"Unrecognized dict bits_spec: {bits_spec}")
-    # string forms: "31..12", "31:12", "31-12", "33-32"
-    s = str(bits_spec).strip()
-    m = re.match(r'^(\d+)\s*(?:\.\.|\:|\-)\s*(\d+)$', s)
-    if m:
-        a, b = int(m.group(1)), int(m.group(2))
-        return (a,b) if a >= b else (b,a)
-    # single number "7"
-    m2 = re.match(r'^(\d+)$', s)
-    if m2:
-        b = int(m2.group(1))
-        return (b,b)
-    raise ValueError(f"Unrecognized bits spec string: '{s}'")
+        return _range_dict(bits_spec)
+    return _range_str(str(bits_spec))
+
+# Matches `kind: csr` (YAML) and `"kind": "csr"` (JSON) anywhere in the file; the key is
+# not always near the top since spec files may open with long license/comment headers.
+_KIND_CSR_RE = re.compile(rb'\bkind["\']?\s*:\s*["\']?csr\b')
+
+# Keys read from a CSR spec (top level / per field); everything else, e.g. IDL
+# sw_write()/reset_value() bodies, is skipped without being constructed
+_CSR_KEYS = frozenset(("kind", "name", "long_name", "length", "description", "writable",
+                       "priv_mode", "definedBy", "fields"))
+_FIELD_KEYS = frozenset(("location", "location_rv32", "location_rv64", "description",
+                         "type", "reset_value", "alias"))
+
+def _construct_key(loader: Any, node: yaml.MappingNode, key_node: yaml.Node) -> Any:
+    """Construct a mapping key, rejecting unhashable ones (e.g. `? [a, b]`) like construct_mapping."""
+    key = loader.construct_object(key_node, deep=True)
+    if not isinstance(key, Hashable):
+        raise yaml.constructor.ConstructorError("while constructing a mapping", node.start_mark,
+                                                "found unhashable key", key_node.start_mark)
+    return key
+
+def _construct_keys(loader: Any, node: yaml.Node, keys: frozenset, fields_key: Optional[str] = None) -> Any:
+    """Construct a mapping node keeping only `keys`; fields_key's entries are filtered by _FIELD_KEYS."""
+    if not isinstance(node, yaml.MappingNode):
+        return loader.construct_object(node, deep=True)
+    loader.flatten_mapping(node)  # resolve `<<` merge keys like construct_mapping does
+    data = {}
+    for key_node, value_node in node.value:
+        key = _construct_key(loader, node, key_node)
+        if key not in keys:
+            continue
+        if key == fields_key and isinstance(value_node, yaml.MappingNode):
+            loader.flatten_mapping(value_node)
+            data[key] = {_construct_key(loader, value_node, k): _construct_keys(loader, v, _FIELD_KEYS)
+                         for k, v in value_node.value}
+        else:
+            data[key] = loader.construct_object(value_node, deep=True)
+    return data
+
+def _load_csr_yaml(raw: bytes) -> Any:
+    """yaml.load restricted to the keys the parser uses: the document is composed in full
+    (in C with libyaml) but only whitelisted subtrees are turned into Python objects."""
+    loader = _Loader(raw)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return None
+        return _construct_keys(loader, node, _CSR_KEYS, fields_key="fields")
+    finally:
+        loader.dispose()
+
+def _parse_file(fn: str) -> Optional[Tuple[str, CSRDefinition]]:
+    """Parse one spec file into (name, CSRDefinition); None if it is not a CSR definition."""
+    try:
+        with open(fn, "rb") as f:
+            raw = f.read()
+        # Cheap pre-scan: files that never say "kind: csr" are not worth a full parse
+        if not _KIND_CSR_RE.search(raw):
+            return None
+        if fn.endswith(".json"):
+            data = _json_loads(raw)
+        else:
+            data = _load_csr_yaml(raw)
+    except (OSError, ValueError, yaml.YAMLError):
+        # unreadable, undecodable or malformed file
+        return None
+    if not data or not isinstance(data, dict):
+        return None
+    # Assume each file is a single CSR object per schema
+    if data.get("kind") != "csr" or "name" not in data:
+        return None
+    name = str(data["name"])
+    g = data.get
+    csr_def = CSRDefinition(name, long_name=g("long_name", ""), length=g("length", 64),
+                            description=g("description", ""), writable=g("writable", False),
+                            priv_mode=g("priv_mode", ""), definedBy=g("definedBy", {}), raw_path=fn)
+    # Parse fields: fields is an object with field names as keys
+    fields_obj = g("fields", {})
+    if isinstance(fields_obj, dict):
+        skipped = 0
+        for field_name, field_data in fields_obj.items():
+            if not isinstance(field_data, dict):
+                skipped += 1
+                continue
+            # Determine location: prefer location, then location_rv64/rv32 (assume 64-bit for now)
+            loc = field_data.get("location")
+            if loc is None:
+                loc = field_data.get("location_rv64")
+            if loc is None:
+                loc = field_data.get("location_rv32")
+            if loc is None:
+                skipped += 1
+                continue
+            try:
+                msb, lsb = parse_range_spec(loc)
+            except (ValueError, TypeError):
+                skipped += 1
+                continue
+            if lsb < 0:
+                # e.g. location: -1 or [5, -1]; the mask would need a negative shift
+                skipped += 1
+                continue
+            csr_def.add_field(CSRField.from_raw(field_name, msb, lsb, field_data))
+        csr_def.skipped_fields = skipped
+    return name, csr_def
+
+_SPEC_SUFFIXES = (".yml", ".yaml", ".json")
+
+# Below this many files a process pool is not worth starting
+_PARALLEL_MIN_FILES = 32
+
+# Pickled CSR definitions live here, one file per spec directory, with an entry per spec
+# file so editing one file only re-parses that file.
+# Bump _CACHE_VERSION whenever CSRField/CSRDefinition change shape.
+_CACHE_VERSION = 12
+_CacheEntry = Tuple[Tuple[int, int], Optional[Tuple[str, CSRDefinition]]]
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "udb-csr")
 
 class UDBParser:
     """
     Loads CSR definitions from a directory (riscv-unified-db/spec/csrs).
     It is tolerant to multiple YAML/JSON schema variants.
     Can also load riscv-config YAML to enrich CSR type information (WARL/WLRL etc.)
+    Parsed definitions are cached per spec file under cache_dir (pass None to disable)
+    and reused while that file keeps the same mtime and size.
     """
-    def __init__(self, csrs_dir: str, riscv_config_yaml: Optional[str] = None):
+    def __init__(self, csrs_dir: str, riscv_config_yaml: Optional[str] = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
         self.csrs_dir = csrs_dir
         self.riscv_config_yaml = riscv_config_yaml
+        self.cache_dir = cache_dir
         self._by_name: Dict[str, CSRDefinition] = {}
+        self._by_name_lower: Dict[str, CSRDefinition] = {}
+        self.skipped_fields = 0  # total over all loaded CSRs, see CSRDefinition.skipped_fields
         self._config_data: Optional[Dict[str, Any]] = None
 
     def load_all(self) -> Dict[str, CSRDefinition]:
-        patterns = [
-            os.path.join(self.csrs_dir, "*.yml"),
-            os.path.join(self.csrs_dir, "*.yaml"),
-            os.path.join(self.csrs_dir, "*.json"),
-        ]
+        # one directory pass instead of a glob per suffix
         files = []
-        for p in patterns:
-            files.extend(glob.glob(p))
-        for fn in sorted(files):
+        try:
+            with os.scandir(self.csrs_dir) as it:
+                for e in it:
+                    if e.name.endswith(_SPEC_SUFFIXES) and not e.name.startswith(".") and e.is_file():
+                        files.append(e.path)
+        except OSError:
+            pass
+        files.sort()
+        # Reuse cached per-file results whose (mtime, size) still match; parse the rest
+        cache = self._load_cache()
+        entries: Dict[str, _CacheEntry] = {}
+        results: Dict[str, Optional[Tuple[str, CSRDefinition]]] = {}
+        stale: List[Tuple[str, Optional[Tuple[int, int]]]] = []
+        for fn in files:
             try:
-                with open(fn, "r", encoding="utf-8") as f:
-                    if fn.endswith(".json"):
-                        data = json.load(f)
-                    else:
-                        data = yaml.safe_load(f)
-            except Exception:
-                continue
-            if not data or not isinstance(data, dict):
-                continue
-            # Assume each file is a single CSR object per schema
-            if data.get("kind") != "csr" or "name" not in data:
-                continue
-            name = str(data["name"])
-            csr_def = CSRDefinition(name, data)
-            # Parse fields: fields is an object with field names as keys
-            fields_obj = data.get("fields", {})
-            if isinstance(fields_obj, dict):
-                for field_name, field_data in fields_obj.items():
-                    if not isinstance(field_data, dict):
-                        continue
-                    try:
-                        # Determine location: prefer location, then location_rv32/rv64 (assume 64-bit for now)
-                        loc = field_data.get("location")
-                        if loc is None:
-                            loc = field_data.get("location_rv64") or field_data.get("location_rv32")
-                        if loc is None:
-                            continue
-                        msb, lsb = parse_range_spec(loc)
-                        desc = field_data.get("description", "")
-                        field_type = field_data.get("type", "")
-                        reset_value = field_data.get("reset_value", None)
-                        alias = field_data.get("alias", "")
-                        csr_def.add_field(CSRField(field_name, msb, lsb, desc, field_type, reset_value, alias))
-                    except Exception:
-                        continue
-            self._by_name[name] = csr_def
+                st = os.stat(fn)
+                key = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                key = None
+            hit = cache.get(fn)
+            if key is not None and hit is not None and hit[0] == key:
+                entries[fn] = hit
+                results[fn] = hit[1]
+            else:
+                stale.append((fn, key))
+        if stale:
+            for (fn, key), result in zip(stale, self._parse_files([fn for fn, _ in stale])):
+                results[fn] = result
+                if key is not None:
+                    entries[fn] = (key, result)
+        if stale or entries.keys() != cache.keys():
+            self._save_cache(entries)
+        # merge in file order so later files still win on duplicate names
+        for fn in files:
+            result = results[fn]
+            if result is not None:
+                name, csr_def = result
+                self._by_name[name] = csr_def
         
         # Load riscv-config YAML if provided to enrich CSR type information
         if self.riscv_config_yaml:
             self._load_riscv_config()
+
+        # Fields are final now; build the decode order once instead of per decode call
+        # and index lowercased names (first spelling wins) so get() never scans
+        self._by_name_lower = {}
+        self.skipped_fields = 0
+        for k, csr_def in self._by_name.items():
+            csr_def.sorted_fields
+            self._by_name_lower.setdefault(k.lower(), csr_def)
+            self.skipped_fields += csr_def.skipped_fields
         
         print(f"Loaded {len(self._by_name)} CSR definitions from {len(files)} files.")
         # print(f"CSR names: {', '.join(sorted(self._by_name.keys()))}")
         # print(f"CSR field names: {', '.join(sorted({f.name for d in self._by_name.values() for f in d.fields}))}")
         return self._by_name
 
+    def _parse_files(self, files: List[str]) -> List[Optional[Tuple[str, CSRDefinition]]]:
+        # Files are independent, so parse them across processes; results keep file order.
+        # Small batches (e.g. a few files changed since the cache was written) are parsed
+        # in-process since worker start-up would cost more than the parsing itself.
+        if len(files) < _PARALLEL_MIN_FILES:
+            return [_parse_file(fn) for fn in files]
+        try:
+            with ProcessPoolExecutor() as ex:
+                return list(ex.map(_parse_file, files, chunksize=16))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # no usable multiprocessing here (e.g. sandboxed /dev/shm, a worker died or the
+            # caller lacks a __main__ guard under spawn); parse serially
+            return [_parse_file(fn) for fn in files]
+
+    def _cache_path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha1(os.path.abspath(self.csrs_dir).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"csrs-{key}.pkl")
+
+    def _load_cache(self) -> Dict[str, _CacheEntry]:
+        """Per-file cache entries {path: ((mtime_ns, size), parse result)}; empty if unusable."""
+        path = self._cache_path()
+        if path is None or not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "rb") as f:
+                version, entries = pickle.load(f)
+        except Exception:
+            return {}
+        if version != _CACHE_VERSION or not isinstance(entries, dict):
+            return {}
+        return entries
+
+    def _save_cache(self, entries: Dict[str, _CacheEntry]):
+        """Write the freshly parsed (not yet riscv-config enriched) definitions atomically."""
+        path = self._cache_path()
+        if path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except Exception as e:
+            print(f"Warning: Failed to write CSR cache {path}: {e}")
+
     def _load_riscv_config(self):
         """Load riscv-config YAML and enrich CSR definitions with type information (WARL/WLRL etc.)"""
         if not self.riscv_config_yaml or not os.path.exists(self.riscv_config_yaml):
             return
         
         try:
-            with open(self.riscv_config_yaml, "r", encoding="utf-8") as f:
-                self._config_data = yaml.safe_load(f)
+            with open(self.riscv_config_yaml, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self._config_data = None  # mmap rejects empty files; nothing to load anyway
+                else:
+                    # let the loader pull pages straight from the mapping instead of
+                    # first copying the (multi-MB) file into one bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self._config_data = yaml.load(mm, Loader=_Loader)
         except Exception as e:
             print(f"Warning: Failed to load riscv-config YAML: {e}")
             return
@@ -248,6 +581,11 @@ class UDBParser:
             
             # Extract field-specific types
             fields_list = rv_data.get("fields")
+            name_idx: Dict[str, CSRField] = {}
+            if fields_list:
+                # case-insensitive field lookup; first field wins on clashes as the old scan did
+                for field in csr_def.fields:
+                    name_idx.setdefault(field.name.lower(), field)
             if fields_list and isinstance(fields_list, list):
                 # In riscv-config, fields is a list of field names
                 # The actual field definitions are at the same level as rv_data keys
@@ -263,11 +601,10 @@ class UDBParser:
                     if field_type_info:
                         access_type, legal_values = self._parse_type_info(field_type_info)
                         # Find matching field in CSR definition
-                        for field in csr_def.fields:
-                            if field.name.lower() == field_name.lower():
-                                field.access_type = access_type
-                                field.legal_values = legal_values
-                                break
+                        field = name_idx.get(field_name.lower())
+                        if field is not None:
+                            field.access_type = access_type
+                            field.legal_values = legal_values
             elif fields_list and isinstance(fields_list, dict):
                 # Alternative format where fields is a dict (less common)
                 for field_name, field_config in fields_list.items():
@@ -278,11 +615,10 @@ class UDBParser:
                     if field_type_info:
                         access_type, legal_values = self._parse_type_info(field_type_info)
                         # Find matching field in CSR definition
-                        for field in csr_def.fields:
-                            if field.name.lower() == field_name.lower():
-                                field.access_type = access_type
-                                field.legal_values = legal_values
-                                break
+                        field = name_idx.get(field_name.lower())
+                        if field is not None:
+                            field.access_type = access_type
+                            field.legal_values = legal_values
             
             enriched_count += 1
         
@@ -326,10 +662,4 @@ class UDBParser:
 
     def get(self, name: str) -> Optional[CSRDefinition]:
         # case-insensitive lookup by simple name
-        if name in self._by_name:
-            return self._by_name[name]
-        low = name.lower()
-        for k,v in self._by_name.items():
-            if k.lower() == low:
-                return v
-        return None
\ No newline at end of file
+        return self._by_name.get(name) or self._by_name_lower.get(name.lower())
\ No newline at end of file